@@ -6,6 +6,7 @@ __author__ = 'Paul Landes'
 from typing import Optional
 from dataclasses import dataclass, field
 import logging
+from operator import itemgetter
 from zensols.cli import ApplicationError
 from . import (
     RenderFileError, LocationType, Extent, Location,
@@ -31,7 +32,7 @@ class Application(object):
 
     def config(self):
         """Print the display configurations."""
-        dsps = sorted(self.browser_manager.displays.items(), key=lambda x: x[0])
+        dsps = sorted(self.browser_manager.displays.items(), key=itemgetter(0))
         for n, dsp in dsps:
             print(f'{n}:')
             dsp.write(1)
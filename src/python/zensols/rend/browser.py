@@ -3,11 +3,13 @@
 """
 from __future__ import annotations
 __author__ = 'Paul Landes'
-from typing import Sequence, Dict, Union, Tuple
+from typing import Any, Sequence, Dict, Union, Tuple
 from dataclasses import dataclass, field
 from abc import ABCMeta, abstractmethod
 import logging
 import platform
+from pprint import pformat
+from functools import lru_cache
 from itertools import chain
 from pathlib import Path
 from pandas import DataFrame
@@ -22,6 +24,16 @@ from . import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_os_browser_section_name() -> str:
+    """Return the app config section name of the platform specific browser.
+    The platform is computed only once since it can not change at runtime.
+
+    """
+    os_name: str = platform.system().lower()
+    return f'rend_{os_name}_browser'
+
+
 @dataclass
 class Browser(Dictable, metaclass=ABCMeta):
     """An abstract base class for browsers the can visually display files.
@@ -74,8 +86,7 @@ class BrowserManager(object):
 
     def __post_init__(self):
         if self.browser is None:
-            os_name: str = platform.system().lower()
-            sec_name: str = f'rend_{os_name}_browser'
+            sec_name: str = _get_os_browser_section_name()
             if sec_name not in self.config_factory.config.sections:
                 sec_name = self.default_browser_name
             try:
@@ -85,30 +96,51 @@ class BrowserManager(object):
             if self.browser is None:
                 sec_name = self.default_browser_name
                 self.browser: Browser = self.config_factory(sec_name)
+        # create the displays once, rather than on the first show
+        self._create_displays()
 
-    @property
-    @persisted('_displays')
-    def displays(self) -> Dict[str, Size]:
-        """The configured displays."""
-        def map_display(name: str) -> Display:
-            targ = Extent(**fac(f'{name}_target').asdict())
-            return Display(**fac(name).asdict() |
-                           {'name': name, 'target': targ})
+    def _create_displays(self):
+        """Create the configured displays indexed by name and by size in one
+        pass over :obj:`display_names`.
 
+        """
         fac = self.config_factory
-        return {d.name: d for d in map(map_display, self.display_names)}
+        self._displays: Dict[str, Display] = {}
+        self._displays_by_size: Dict[Size, Display] = {}
+        name: str
+        for name in self.display_names:
+            size = fac(name)
+            targ = fac(f'{name}_target')
+            # the position of the target extent is optional
+            display = Display(
+                name=name,
+                width=size.width,
+                height=size.height,
+                target=Extent(
+                    width=targ.width,
+                    height=targ.height,
+                    x=getattr(targ, 'x', 0),
+                    y=getattr(targ, 'y', 0)))
+            self._displays[name] = display
+            self._displays_by_size[Size(display.width, display.height)] = \
+                display
+
+    @property
+    def displays(self) -> Dict[str, Display]:
+        """The configured displays."""
+        return self._displays
 
+    @persisted('_default_extent')
     def _get_extent(self) -> Extent:
+        """Return the extent of the display matching the current screen size,
+        which is computed only once since the displays do not change.
+
+        """
         screen: Size = self.browser.screen_size
         displays: Dict[Size, Display] = self.displays_by_size
         display: Display = displays.get(screen)
         if logger.isEnabledFor(logging.TRACE):
-            from pprint import pprint
-            from io import StringIO
-            sio = StringIO()
-            sio.write('displays:\n')
-            pprint(displays, sio)
-            logger.debug(f'displays: {sio.getvalue()}')
+            logger.debug(f'displays:\n{pformat(displays)}')
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f'detected: {screen} -> {display}')
         if display is None:
@@ -123,10 +155,9 @@ class BrowserManager(object):
         return extent
 
     @property
-    @persisted('_displays_by_size')
     def displays_by_size(self) -> Dict[Size, Display]:
         """A dictionary of displays keyed by size."""
-        return {Size(d.width, d.height): d for d in self.displays.values()}
+        return self._displays_by_size
 
     def dataframe_to_location(self, df: DataFrame, name: str = None) -> \
             Location:
@@ -141,6 +172,32 @@ class BrowserManager(object):
         df_source = CachedDataFrameSource(df, name)
         return DataFrameLocation(df_source)
 
+    def _to_locations(self, data: Any) -> Tuple[Location, ...]:
+        """Create the locations of ``data`` without an extent or transmuting,
+        which is left to the top level :meth:`to_presentation` call.
+
+        """
+        locs: Tuple[Location, ...]
+        if isinstance(data, (str, Path)):
+            loc_type: LocationType = LocationType.from_type(data)
+            locs = (Location(source=data, type=loc_type),)
+        elif isinstance(data, Presentation):
+            locs = data.locations
+        elif isinstance(data, Location):
+            locs = (data,)
+        elif isinstance(data, DataFrame):
+            locs = (self.dataframe_to_location(data),)
+        elif isinstance(data, Sequence):
+            locs = tuple(chain.from_iterable(map(self._to_locations, data)))
+        elif isinstance(data, DataFrameDescriber):
+            locs = self._to_locations(DataDescriber(describers=(data,)))
+        elif isinstance(data, DataDescriber):
+            from .df import DataDescriberLocation
+            locs = (DataDescriberLocation(data),)
+        else:
+            raise RenderFileError(f'Unsupported location type: {type(data)}')
+        return locs
+
     def to_presentation(self, data: Union[str, Path, Presentation, Location, DataFrame, List],
                         extent: Extent = None, transmute: bool = True) \
             -> Presentation:
@@ -149,40 +206,24 @@ class BrowserManager(object):
 
         :param data: the data (image file, URL, Pandas dataframe) to display
 
-        :param extent: the position and size of the window after browsing
+        :param extent: the position and size of the window after browsing,
+                       which defaults to the extent of ``data`` when it is a
+                       presentation that has one, or the display's extent
 
         :param transmute: whether to apply :class:`.LocationTransmuter` instanes
 
         """
         pres: Presentation
-        if isinstance(data, (str, Path)):
-            loc_type: LocationType = LocationType.from_type(data)
-            loc: Location = Location(source=data, type=loc_type)
-            pres = Presentation(locations=(loc,))
-        elif isinstance(data, Presentation):
+        if isinstance(data, Presentation):
             pres = data
-        elif isinstance(data, Location):
-            pres = Presentation(locations=(data,))
-        elif isinstance(data, DataFrame):
-            loc: Location = self.dataframe_to_location(data)
-            pres = Presentation(locations=(loc,))
-        elif isinstance(data, Sequence):
-            pres = Presentation(
-                locations=tuple(chain.from_iterable(map(
-                    lambda loc: self.to_presentation(loc).locations, data))))
-        elif isinstance(data, DataFrameDescriber):
-            pres = self.to_presentation(DataDescriber(describers=(data,)))
-        elif isinstance(data, DataDescriber):
-            from .df import DataDescriberLocation
-            loc: Location = DataDescriberLocation(data)
-            pres = Presentation(locations=(loc,))
         else:
-            raise RenderFileError(f'Unsupported location type: {type(data)}')
-        pres.extent = self._get_extent() if extent is None else extent
+            pres = Presentation(locations=self._to_locations(data))
+        if extent is not None:
+            pres.extent = extent
+        elif pres.extent is None:
+            pres.extent = self._get_extent()
         if transmute:
-            lt: LocationTransmuter
-            for lt in self.transmuters:
-                pres.apply_transmuter(lt)
+            pres.apply_transmuters(self.transmuters)
         return pres
 
     def show(self,
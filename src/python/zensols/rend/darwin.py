@@ -3,12 +3,14 @@
 """
 __author__ = 'Paul Landes'
 
-from typing import Dict, Sequence, Set, Tuple, Union, TYPE_CHECKING
+from typing import (
+    Dict, Sequence, Set, Tuple, Union, Optional, ClassVar, TYPE_CHECKING
+)
 from dataclasses import dataclass, field
 from enum import Enum, auto
 import logging
-import textwrap
-import re
+from functools import reduce
+from operator import attrgetter
 from pathlib import Path
 from zensols.config import ConfigFactory
 from . import (
@@ -36,6 +38,9 @@ class ErrorType(Enum):
 
 @dataclass
 class DarwinBrowser(Browser):
+    _MAX_DISPLAYS: ClassVar[int] = 32
+    """The maximum number of active displays read from Quartz."""
+
     config_factory: ConfigFactory = field()
     """The configuration factory used to create a default :class:`.Browser`
     instance for URL viewing.
@@ -47,7 +52,10 @@ class DarwinBrowser(Browser):
 
     """
     web_extensions: Set[str] = field()
-    """Extensions that indicate to use Safari.app rather than Preview.app."""
+    """Extensions that indicate to use Safari.app rather than Preview.app, which
+    are matched case insensitively.
+
+    """
 
     applescript_warns: Dict[str, str] = field()
     """A set of string warning messages to log instead raise as an
@@ -59,7 +67,8 @@ class DarwinBrowser(Browser):
     ``True``, then record page before refresh, then go to the page after
     rendered.  This is helpful when the PDF has changed and preview goes back to
     the first page.  If this is a number, then go to that page number in
-    Preview.app.
+    Preview.app.  When set, multiple files are opened one at a time rather than
+    with a single script invocation so the page of each can be updated.
 
     """
     switch_back_app: str = field(default=None)
@@ -69,6 +78,15 @@ class DarwinBrowser(Browser):
     """Whether to add ending ``/`` neede by Safari on macOS."""
 
     def __post_init__(self):
+        # match case insensitively against path suffixes, which include the
+        # leading dot
+        self._web_suffixes: Set[str] = frozenset(
+            map(lambda e: '.' + e.lstrip('.').lower(), self.web_extensions))
+        # script name to content read from script_paths
+        self._scripts: Dict[str, str] = {}
+        # script name, function and whether to switch back to script content
+        # and start of the call
+        self._call_templates: Dict[Tuple[str, str, bool], str] = {}
         # try to install the applescript module if possible
         self._assert_applescript()
         # raise error now so BrowserManager can recover
@@ -105,7 +123,7 @@ class DarwinBrowser(Browser):
             ret = applescript.tell.app(app, cmd)
         if ret.code != 0:
             err_type: ErrorType = self._get_error_type(ret)
-            cmd_str: str = textwrap.shorten(cmd, 40)
+            cmd_str: str = cmd if len(cmd) <= 40 else cmd[:37] + '...'
             msg: str = f'Could not invoke <{cmd_str}>: {ret.err} ({ret.code})'
             if err_type == ErrorType.warning:
                 logger.warning(msg)
@@ -116,9 +134,32 @@ class DarwinBrowser(Browser):
         return ret.out
 
     def get_show_script(self, name: str) -> str:
-        """The applescript content used for managing app ``name``."""
-        with open(self.script_paths[name]) as f:
-            return f.read()
+        """The applescript content used for managing app ``name``.  Each script
+        is read only once since it does not change during the process.
+
+        """
+        script: str = self._scripts.get(name)
+        if script is None:
+            script = self.script_paths[name].read_text()
+            self._scripts[name] = script
+        return script
+
+    def _get_call_template(self, name: str, func: str = None) -> str:
+        """Return the script content of ``name`` followed by the start of the
+        call to its function ``func``, which is created once per script,
+        function and whether to switch back.  The call starts a ``try`` block
+        when switching back, which :meth:`_get_switch_back_script` ends.
+
+        """
+        switch_back: bool = self.switch_back_app is not None
+        key: Tuple[str, str, bool] = (name, func, switch_back)
+        template: str = self._call_templates.get(key)
+        if template is None:
+            func = f'show{name.capitalize()}' if func is None else func
+            start: str = 'try\n' if switch_back else ''
+            template = f'{self.get_show_script(name)}\n{start}{func}('
+            self._call_templates[key] = template
+        return template
 
     def _invoke_open_script(self, name: str, arg: str, extent: Extent,
                             func: str = None, add_quotes: bool = True,
@@ -133,43 +174,77 @@ class DarwinBrowser(Browser):
         :param exent: the bounds to set on the raised window
 
         """
-        show_script: str = self.get_show_script(name)
         qstr: str = '"' if add_quotes else ''
-        update_page: str
-        page_num: str = 'null'
-        if isinstance(self.update_page, bool):
-            update_page = str(self.update_page).lower()
-            page_num = 'null'
-        else:
-            update_page = 'true'
-            page_num = str(self.update_page)
-        func: str = f'show{name.capitalize()}' if func is None else func
         file_form: str
         if is_file:
             # add single quote for files with spaces in the name
             file_form = f"{qstr}'{arg}'{qstr}"
         else:
             file_form = f'{qstr}{arg}{qstr}'
-        fn = (f'{func}({file_form}, {extent.x}, {extent.y}, ' +
-              f'{extent.width}, {extent.height}, {update_page}, {page_num})')
-        cmd = (show_script + '\n' + fn)
+        args = (f'{file_form}, {extent.x}, {extent.y}, ' +
+                f'{extent.width}, {extent.height}, {self._get_page_args()})')
+        cmd = self._get_call_template(name, func) + args + \
+            self._get_switch_back_script()
         if logger.isEnabledFor(logging.DEBUG):
             path: Path = self.script_paths[name]
-            logger.debug(f'invoking "{fn}" from {path}')
+            logger.debug(f'invoking "{name}" with ({args} from {path}')
         self._exec(cmd)
-        self._switch_back()
 
-    def _switch_back(self):
-        """Optionally active an application after running the show-script, which
-        is usually the previous running application.
+    def _get_switch_back_script(self) -> str:
+        """Return the script that optionally actives an application after
+        running the show-script, which is usually the previous running
+        application.  This is appended to the show-script so both run in the
+        same ``osascript`` invocation.  It ends the ``try`` block started by
+        :meth:`_get_call_template` so the application is activated even when
+        the show-script fails, and then raises the error again.
 
         """
-        if self.switch_back_app is not None:
-            self._exec(f'tell application "{self.switch_back_app}" to activate')
+        if self.switch_back_app is None:
+            return ''
+        app: str = self.switch_back_app
+        activate: str = f'tell application "{app}" to activate'
+        return ('\non error errMsg number errNum\n' +
+                f'{activate}\nerror errMsg number errNum\nend try\n{activate}')
+
+    def _get_page_args(self) -> str:
+        """Return the update page and page number arguments of the
+        show-scripts, which are built for each call since :obj:`update_page`
+        can change after this instance is created.
+
+        """
+        if isinstance(self.update_page, bool):
+            return f'{str(self.update_page).lower()}, null'
+        else:
+            return f'true, {self.update_page}'
+
+    def _get_quartz_screen_size(self) -> Optional[Size]:
+        """Get the screen size in process with the pyobjc Quartz bindings, or
+        ``None`` if they are not installed.  Like the Finder desktop window
+        bounds, this is the bottom right corner of all active displays.
+
+        """
+        try:
+            import Quartz
+        except ImportError:
+            return None
+        err, ids, cnt = Quartz.CGGetActiveDisplayList(
+            self._MAX_DISPLAYS, None, None)
+        if err != 0 or cnt == 0:
+            return None
+        bounds = reduce(Quartz.CGRectUnion,
+                        map(Quartz.CGDisplayBounds, ids[:cnt]))
+        return Size(int(Quartz.CGRectGetMaxX(bounds)),
+                    int(Quartz.CGRectGetMaxY(bounds)))
 
     def _get_screen_size(self) -> Size:
+        size: Size = self._get_quartz_screen_size()
+        if size is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f'screen size from Quartz: {size}')
+            return size
         bstr: str = self._exec('bounds of window of desktop', 'Finder')
-        bounds: Sequence[int] = tuple(map(int, re.split(r'\s*,\s*', bstr)))
+        # int() ignores the whitespace around the commas
+        bounds: Sequence[int] = tuple(map(int, bstr.split(',')))
         width, height = bounds[2:]
         return Size(width, height)
 
@@ -182,16 +257,29 @@ class DarwinBrowser(Browser):
         self._invoke_open_script('preview', str(path.absolute()),
                                  extent, is_file=True)
 
+    def _show_files(self, paths: Tuple[Path], extent: Extent):
+        def map_path(path: Path) -> str:
+            path_str: str = str(path.absolute())
+            path_str = path_str.replace('\\', '\\\\').replace('"', '\\"')
+            return f'"{path_str}"'
+
+        path_str: str = ','.join(map(map_path, paths))
+        path_str = "{" + path_str + "}"
+        self._invoke_open_script(
+            name='preview-multi',
+            arg=path_str,
+            func='showPreviewMulti',
+            extent=extent,
+            add_quotes=False)
+
     def _show_url(self, url: str, extent: Extent):
         url = self._safari_compliant_url(url)
         self._invoke_open_script('safari', url, extent)
 
     def _show_urls(self, urls: Tuple[str], extent: Extent):
-        def map_url(url: str) -> str:
-            url = self._safari_compliant_url(url)
-            return f'"{url}"'
-
-        url_str: str = ','.join(map(map_url, urls))
+        if self.mangle_url:
+            urls = tuple(map(self._safari_compliant_url, urls))
+        url_str: str = ','.join(f'"{url}"' for url in urls)
         url_str = "{" + url_str + "}"
         self._invoke_open_script(
             name='safari-multi',
@@ -204,7 +292,7 @@ class DarwinBrowser(Browser):
         def map_loc(loc: Location) -> Location:
             if loc.is_file_url or loc.type == LocationType.file:
                 path: Path = loc.path
-                if path.suffix[1:] in self.web_extensions:
+                if path.suffix.lower() in self._web_suffixes:
                     loc.coerce_type(LocationType.url)
             return loc
 
@@ -212,18 +300,19 @@ class DarwinBrowser(Browser):
         urls: Tuple[str] = None
         locs: Tuple[Location] = tuple(map(map_loc, presentation.locations))
         if len(locs) > 1:
-            loc_set: Set[LocationType] = set(map(lambda lc: lc.type, locs))
-            if len(loc_set) != 1 or next(iter(loc_set)) != LocationType.file:
-                urls = tuple(map(lambda loc: loc.url, locs))
+            # stop at the first non-file since any URL shows all as URLs
+            if any(map(lambda loc: loc.type != LocationType.file, locs)):
+                urls = tuple(map(attrgetter('url'), locs))
         if urls is not None:
             self._show_urls(urls, extent)
+        elif len(locs) > 1 and not self.update_page:
+            # open all files with one script invocation, which can not update
+            # the page of each file
+            self._show_files(tuple(map(lambda loc: loc.path, locs)), extent)
         else:
             loc: Location
-            for loc in presentation.locations:
-                if loc.type == LocationType.file:
+            for loc in locs:
+                if loc.type == LocationType.file or loc.is_file_url:
                     self._show_file(loc.path, extent)
                 else:
-                    if loc.is_file_url:
-                        self._show_file(loc.path, extent)
-                    else:
-                        self._show_url(loc.url, extent)
+                    self._show_url(loc.url, extent)
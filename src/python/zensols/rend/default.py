@@ -3,27 +3,40 @@
 """
 __author__ = 'Paul Landes'
 
-from typing import List, Tuple
+from typing import List
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import webbrowser
-import screeninfo as si
-from screeninfo.common import Monitor
 from . import Size, Location, Presentation, Browser
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_primary_monitor_size() -> Size:
+    """Return the size of the primary monitor, or the first if there is no
+    primary.  The monitors are queried only once per process since it is a
+    round trip to the windowing system.
+
+    """
+    # import here to load the platform display bindings only when needed
+    import screeninfo as si
+    from screeninfo.common import Monitor
+    mons: List[Monitor] = si.get_monitors()
+    mon: Monitor = next(filter(lambda m: m.is_primary, mons), None)
+    if mon is None:
+        mon = mons[0]
+    return Size(mon.width, mon.height)
+
+
 @dataclass
 class WebBrowser(Browser):
     """A class that displays a file or URL in a web browser.
 
     """
     def _get_screen_size(self) -> Size:
-        mons: List[Monitor] = si.get_monitors()
-        primes: Tuple[Monitor] = tuple(filter(lambda m: m.is_primary, mons))
-        mon: Monitor = primes[0] if len(primes) > 0 else mons[0]
-        return Size(mon.width, mon.height)
+        return _get_primary_monitor_size()
 
     def _open_url(self, url: str):
         if logger.isEnabledFor(logging.INFO):
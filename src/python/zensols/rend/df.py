@@ -1,35 +1,46 @@
 """Classes that render Pandas dataframes.
 
 """
+from __future__ import annotations
 __author__ = 'Paul Landes'
-
 from typing import (
-    Callable, Union, Optional, Iterable, Tuple, Dict, Set, ClassVar
+    Callable, Union, Optional, Iterable, Tuple, List, Dict, Set, Any, ClassVar,
+    TYPE_CHECKING
 )
 from dataclasses import dataclass, field
 from abc import abstractmethod, ABCMeta
 from pathlib import Path
+import sys
 import logging
-import time
-import multiprocessing
-from queue import Empty
+from functools import lru_cache
+from operator import itemgetter
+import math
+import socket
+import threading
 import pandas as pd
 import numpy as np
-from flask import Flask
-import waitress
-from dash import Dash, html
-from dash.dash_table import DataTable
-import dash_bootstrap_components as dbc
-from dash import Input, Output
 from zensols.config import ConfigFactory
 from zensols.persist import Deallocatable
 from zensols.datdesc import DataFrameDescriber, DataDescriber
 from . import RenderFileError, Location, LocationTransmuter
+# the Dash, Flask and Waitress packages are imported when a table is rendered
+# since they are slow to load and not needed for files and URLs
+if TYPE_CHECKING:
+    from dash import Dash, html
+    from dash.dash_table import DataTable
 
 
 logger = logging.getLogger(__name__)
 
 
+def _intern_column(col: Any) -> Any:
+    """Intern string column names, which are repeated across the table's column
+    definitions and tooltips.
+
+    """
+    return sys.intern(col) if isinstance(col, str) else col
+
+
 @dataclass
 class DataFrameSource(object, metaclass=ABCMeta):
     """Generates a dataframe.
@@ -82,7 +93,19 @@ class PathDataFrameSource(DataFrameSource):
     sheet_name: Union[int, str] = field(default=0)
     """The sheet number or name if an Excel file."""
 
+    csv_engine: str = field(default='c')
+    """The pandas parser engine used for CSV and TSV files.  The ``pyarrow``
+    engine is faster, but infers more types (such as timestamps) than the
+    default ``c`` engine, so the same file can render differently.
+
+    """
+    def __post_init__(self):
+        # the modification time and parsed dataframe of the last read
+        self._cached_df: Tuple[float, pd.DataFrame] = None
+
     def get_name(self) -> str:
+        if isinstance(self.sheet_name, str):
+            return self.sheet_name
         return str(self.path)
 
     @staticmethod
@@ -102,31 +125,52 @@ class PathDataFrameSource(DataFrameSource):
         return ext in cls._EXTENSIONS
 
     @classmethod
-    def from_path(cls, path: Path) -> Tuple[DataFrameSource]:
-        def map_sheet(t: Tuple[str, pd.DataFrame]) -> DataFrameSource:
-            src = CachedDataFrameSource(t[1])
-            src._name = t[0]
-            return src
+    def from_path(cls, path: Path, csv_engine: str = 'c') -> \
+            Tuple[DataFrameSource, ...]:
+        """Create a source for each sheet of an Excel file, or a single source
+        for any other file.  Sheets are parsed only when their dataframe is
+        requested.
+
+        :param csv_engine: see :obj:`csv_engine`
 
+        """
         ext: str = cls.get_extesion(path)
         if ext == 'xlsx':
-            sheets: Dict[str, pd.DataFrame] = pd.read_excel(
-                path, sheet_name=None)
-            return tuple(map(map_sheet, sheets.items()))
-        return (PathDataFrameSource(path),)
+            with pd.ExcelFile(path) as xls:
+                sheet_names: List[str] = xls.sheet_names
+            return tuple(map(lambda n: PathDataFrameSource(path, sheet_name=n),
+                             sheet_names))
+        return (PathDataFrameSource(path, csv_engine=csv_engine),)
+
+    def _read_csv(self, path: Path, sep: str = ',') -> pd.DataFrame:
+        """Read a delimited file with the :obj:`csv_engine` parser."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'parsing {path} with engine: {self.csv_engine}')
+        return pd.read_csv(path, sep=sep, engine=self.csv_engine)
 
-    def get_dataframe(self) -> pd.DataFrame:
-        """Procure the dataframe from this source."""
+    def _read_dataframe(self) -> pd.DataFrame:
         ext: str = self.get_extesion(self.path)
         if not self.is_supported_extension(ext):
             raise RenderFileError(f'Unsupported extension: {ext}')
         fn: Callable = {
-            'csv': pd.read_csv,
-            'tsv': lambda p: pd.read(p, sept='\t'),
+            'csv': self._read_csv,
+            'tsv': lambda p: self._read_csv(p, sep='\t'),
             'xlsx': lambda p: pd.read_excel(p, sheet_name=self.sheet_name),
         }[ext]
         return fn(self.path)
 
+    def get_dataframe(self) -> pd.DataFrame:
+        """Procure the dataframe from this source.  The file is parsed only on
+        the first call or after it has been modified since it was last read.
+
+        """
+        mtime: float = self.path.stat().st_mtime
+        if self._cached_df is None or self._cached_df[0] != mtime:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f'reading dataframe: {self.path}')
+            self._cached_df = (mtime, self._read_dataframe())
+        return self._cached_df[1]
+
 
 @dataclass
 class LayoutFactory(object, metaclass=ABCMeta):
@@ -153,6 +197,14 @@ class LayoutFactory(object, metaclass=ABCMeta):
         """
         pass
 
+    def create_data_callback(self, dash: Dash):
+        """Add callbacks to ``dash`` that provide the layout's data on demand.
+        By default, all data is given with the layout and no callbacks are
+        added.
+
+        """
+        pass
+
 
 @dataclass
 class DataFrameLayoutFactory(LayoutFactory, metaclass=ABCMeta):
@@ -161,6 +213,54 @@ class DataFrameLayoutFactory(LayoutFactory, metaclass=ABCMeta):
     callback that is used to terminate the :class:`.TerminalDashServer`.
 
     """
+    _CSS: ClassVar[Tuple[Dict[str, str]]] = (
+        # take the relative window width
+        {'selector': 'table',
+         'rule': 'width: 100%;'},
+        # subtract the title element height from the total viewport
+        {'selector': '.dash-spreadsheet.dash-freeze-top, .dash-spreadsheet .dash-virtualized',
+         'rule': 'max-height: calc(100vh - 90px);'},
+        # without this, header tooltips have extra space
+        {'selector': '.dash-table-tooltip',
+         'rule': 'min-width: unset;'},
+    )
+    """The static table CSS rules, which are extended with the row height."""
+
+    _STYLE_TABLE: ClassVar[Dict[str, str]] = {
+        'overflowY': 'scroll',
+        'border': '1px solid grey',
+        'height': '100%',
+        'maxHeight': '100%',
+    }
+    """The data table style."""
+
+    _STYLE_HEADER: ClassVar[Dict[str, str]] = {
+        'backgroundColor': 'rgb(180, 180, 180)',
+        'color': 'black',
+        'fontWeight': 'bold',
+        'padding': '5px',
+    }
+    """The column header style."""
+
+    _STYLE_CELL: ClassVar[Dict[str, str]] = {
+        'font-family': 'sans-serif',
+        'border': '1px solid grey',
+    }
+    """The static cell style, which is extended with the font size and column
+    width.
+
+    """
+    _STYLE_DATA: ClassVar[Dict[str, str]] = {
+        'color': 'black',
+        'backgroundColor': 'white',
+        'maxWidth': '300px',
+        'minWidth': '50px',
+    }
+    """The static data style, which is extended with the cell wrap style."""
+
+    _SORT_CACHE_SIZE: ClassVar[int] = 4
+    """The number of sorted dataframes kept for server side paging."""
+
     page_size: int = field(default=100)
     """The max number of rows displayed in the window before paging out."""
 
@@ -188,6 +288,14 @@ class DataFrameLayoutFactory(LayoutFactory, metaclass=ABCMeta):
     data_font_size: int = field(default=12)
     """The font size of the data in the table."""
 
+    server_paging: bool = field(default=False)
+    """Whether to page and sort the data on the server rather than sending all
+    rows to the browser.  This limits the page payload to :obj:`page_size` rows,
+    but the server has to keep running to serve pages, so no terminate callback
+    is created and the server serves until the process is interrupted.  Column
+    filtering is not supported when this is ``True``.
+
+    """
     @abstractmethod
     def _get_dataframe(self) -> pd.DataFrame:
         pass
@@ -198,94 +306,125 @@ class DataFrameLayoutFactory(LayoutFactory, metaclass=ABCMeta):
         :class:`~zensols.datdesc.desc.DataFrameDescriber`.
 
         """
-        return {i: i for i in df.columns}
+        return {i: i for i in map(_intern_column, df.columns)}
 
     def _create_data_table(self) -> DataTable:
-        def filter_left_col(dtype) -> bool:
-            return not np.issubdtype(dtype, np.number)
-
+        from dash.dash_table import DataTable
         df: pd.DataFrame = self._get_dataframe()
-        col_left_aligns = map(lambda c: c[0],
-                              filter(lambda c: filter_left_col(c[1]),
-                                     zip(df.columns, df.dtypes)))
+        # left align non-numeric columns
+        left_aligns: Set[Any] = \
+            set(df.select_dtypes(exclude=np.number).columns)
+        columns: List[Dict[str, Any]] = []
+        cell_conds: List[Dict[str, Any]] = []
+        col: Any
+        for col in map(_intern_column, df.columns):
+            columns.append({
+                'name': col,
+                'id': col,
+                'deletable': self.column_deletable,
+                'selectable': True})
+            if col in left_aligns:
+                cell_conds.append({
+                    'if': {'column_id': col},
+                    'textAlign': 'left'})
+        sort_action: str = 'none'
+        paging: Dict[str, Any]
+        if self.server_paging:
+            if self.column_filterable:
+                raise RenderFileError(
+                    'Column filtering is not supported with server paging')
+            if self.column_sort:
+                sort_action = 'custom'
+            # the rows are populated by the data callback
+            paging = dict(
+                data=[],
+                page_action='custom',
+                page_current=0,
+                page_count=math.ceil(len(df) / self.page_size))
+        else:
+            if self.column_sort:
+                sort_action = 'native'
+            paging = dict(data=df.to_dict('records'))
         if self.cell_wrap:
             style_data = {'whiteSpace': 'normal'}
         else:
             style_data = {'overflow': 'hidden', 'textOverflow': 'ellipsis'}
+        col_width: str = f'{self.column_width_px}px'
         return DataTable(
             id='datatable-paging',
-            data=df.to_dict('records'),
             page_size=self.page_size,
-            columns=[
-                {'name': i,
-                 'id': i,
-                 'deletable': self.column_deletable,
-                 'selectable': True}
-                for i in df.columns
-            ],
+            columns=columns,
             tooltip_header=self._get_column_tooltips(df),
             # disable tooltips from going away
             tooltip_delay=0,
             tooltip_duration=None,
             filter_action='native' if self.column_filterable else 'none',
-            sort_action='native' if self.column_sort else 'none',
+            sort_action=sort_action,
             sort_mode='multi',
             row_deletable=self.row_deletable,
             fixed_rows={'headers': True, 'data': 0},
             css=[
-                # take the relative window width
-                {'selector': 'table',
-                 'rule': 'width: 100%;'},
-                # subtract the title element height from the total viewport
-                {'selector': '.dash-spreadsheet.dash-freeze-top, .dash-spreadsheet .dash-virtualized',
-                 'rule': 'max-height: calc(100vh - 90px);'},
-                # without this, header tooltips have extra space
-                {'selector': '.dash-table-tooltip',
-                 'rule': 'min-width: unset;'},
+                *self._CSS,
                 {'selector': '.dash-spreadsheet tr',
                  'rule': f'height: {self.row_height_px}px;'},
             ],
-            style_table={
-                'overflowY': 'scroll',
-                'border': '1px solid grey',
-                'height': '100%',
-                'maxHeight': '100%',
-            },
-            style_header={
-                'backgroundColor': 'rgb(180, 180, 180)',
-                'color': 'black',
-                'fontWeight': 'bold',
-                'padding': '5px',
-            },
-            style_cell={
+            style_table=self._STYLE_TABLE,
+            style_header=self._STYLE_HEADER,
+            style_cell=self._STYLE_CELL | {
                 'fontSize': self.data_font_size,
-                'font-family': 'sans-serif',
-                'border': '1px solid grey',
-                'minWidth':
-                '{w}px', 'width': '{w}px', 'maxWidth': '{w}px'.
-                format(w=self.column_width_px),
+                'minWidth': col_width,
+                'width': col_width,
+                'maxWidth': col_width,
             },
-            style_cell_conditional=[{
-                'if': {'column_id': c},
-                'textAlign': 'left'
-            } for c in col_left_aligns],
-            style_data={
-                'color': 'black',
-                'backgroundColor': 'white',
-                'maxWidth': '300px',
-                'minWidth': '50px',
-            } | style_data,
+            style_cell_conditional=cell_conds,
+            style_data=self._STYLE_DATA | style_data,
             style_data_conditional=[{
                 'if': {'row_index': 'odd'},
                 'backgroundColor': 'rgb(230, 230, 230)',
-            }])
+            }],
+            **paging)
 
     def create_terminate_callback(self, dash: Dash) -> Optional[Callable]:
-        return dash.callback(
-            Output('server-kill-button-container', 'children'),
-            Input('server-kill-submit', 'n_clicks'))
+        from dash import Input, Output
+        if not self.server_paging:
+            return dash.callback(
+                Output('server-kill-button-container', 'children'),
+                Input('server-kill-submit', 'n_clicks'))
+
+    def create_data_callback(self, dash: Dash):
+        if not self.server_paging:
+            return
+
+        from dash import Input, Output
+
+        @lru_cache(maxsize=self._SORT_CACHE_SIZE)
+        def sort(sort_key: Tuple[Tuple[str, str], ...]) -> pd.DataFrame:
+            return df.sort_values(
+                by=list(map(itemgetter(0), sort_key)),
+                ascending=list(map(lambda s: s[1] == 'asc', sort_key)))
+
+        def get_page(page_current: int, page_size: int,
+                     sort_by: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+            pdf: pd.DataFrame = df
+            if sort_by:
+                # paging through the same sort order reuses the sorted frame
+                pdf = sort(tuple(map(
+                    lambda s: (s['column_id'], s['direction']), sort_by)))
+            start: int = page_current * page_size
+            return pdf.iloc[start:start + page_size].to_dict('records')
+
+        # keep the dataframe in the callback's closure so only a page of rows
+        # is materialized per request
+        df: pd.DataFrame = self._get_dataframe()
+        dash.callback(
+            Output('datatable-paging', 'data'),
+            Input('datatable-paging', 'page_current'),
+            Input('datatable-paging', 'page_size'),
+            Input('datatable-paging', 'sort_by'))(get_page)
 
     def create_layout(self) -> html.Div:
+        from dash import html
+        import dash_bootstrap_components as dbc
         return html.Div(
             [
                 html.Div(
@@ -367,14 +506,13 @@ class DataFrameDescriberLayoutFactory(DataFrameLayoutFactory):
         return self.source.df_with_index_meta(self.index_meta_format)
 
     def _get_column_tooltips(self, df: pd.DataFrame) -> Dict[str, str]:
-        def map_col(c: str):
-            v: str = cols.get(c)
+        def map_col(cv: Tuple[str, str]) -> Tuple[str, str]:
+            c, v = cv
             if v is not None and v != c:
                 v = self.column_meta_format.format(c=c, v=v)
-            return c, v
+            return _intern_column(c), v
 
-        cols: Dict[str, str] = self.source.asdict()
-        return dict(map(map_col, cols.keys()))
+        return dict(map(map_col, self.source.asdict().items()))
 
 
 @dataclass
@@ -420,18 +558,31 @@ class DataDescriberLocation(Location):
 @dataclass
 class TerminalDashServer(object):
     """A server that takes a single incoming request, renderes the client's
-    page, the exists the interpreter.  This server can continue to run to serve
-    requests without a terminating callback.  The lifecycle includes:
+    page, then stops.  This server can continue to run to serve requests without
+    a terminating callback.  The lifecycle includes:
 
-      1. Create a multiprocessing queue.
-      2. Fork a child process ``C`` from parent process ``P``.
-      3. ``C`` starts the Flask service, which binds to a port on localhost.
-      4. The framework in ``P`` continues to renderer any other queued data.
+      1. Create an event used to signal when the page is rendered.
+      2. Bind the Waitress server to a port on localhost.
+      3. Serve the Flask/Dash application in daemon thread ``T``.
+      4. The framework continues to renderer any other queued data.
       5. The client browser creates a single request to render the Dash data.
       6. Once the browser renders, a callback indicates to terminate the server.
-      7. After rendering all data, ``P`` waits for the child process via IPC.
-      8. The terminate callback in ``C`` sends a queue (IPC) message to ``P``.
-      9. Upon receiving this message, the ``P`` terminates ``C``.
+      7. After rendering all data, the framework waits on the event.
+      8. The terminate callback in ``T`` sets the event.
+      9. Once the event is set, the server is closed, which ends ``T``.
+
+    """
+    _WAITRESS_ARGS: ClassVar[Dict[str, Any]] = dict(
+        threads=4,
+        connection_limit=16,
+        channel_timeout=30)
+    """Waitress server resource limits, which only needs to serve the page, its
+    assets and callbacks to one local browser.
+
+    """
+    _STARTED: ClassVar[Dict[str, TerminalDashServer]] = {}
+    """The servers, keyed by URL, that are started and not yet closed.  All are
+    closed on the first interrupt while serving.
 
     """
     layout_factory: LayoutFactory = field()
@@ -444,28 +595,40 @@ class TerminalDashServer(object):
     """The host interface on which to start the host."""
 
     sleep_secs: float = field(default=1)
-    """The time to wait and allow the Dash server to start and the URL available
-    for the browser.
+    """The maximum time to wait for the Dash server to accept connections so the
+    URL is available for the browser.
 
     """
     timeout_secs: float = field(default=5)
-    """The timeout in seconds to wait for the child to quit before it is
-    terminated.
+    """The timeout in seconds to wait for the page to render before the server
+    is closed.
 
     """
     def __post_init__(self):
         self._shutdown = False
+        self._server = None
+        self._terminates = True
 
     @property
     def url(self) -> str:
         return f'http://{self.host}:{self.port}'
 
     def _shutdown_callback(self, n_clicks: int):
+        from flask import after_this_request, Response
+
+        def signal_on_close(response: Response) -> Response:
+            # signal after the callback's response is written so closing the
+            # server does not cut it off
+            response.call_on_close(self._rendered.set)
+            return response
+
         logger.debug('page load complete')
-        time.sleep(1)
-        self._queue.put(1)
+        after_this_request(signal_on_close)
 
     def _create_flask(self):
+        from flask import Flask
+        from dash import Dash
+        import dash_bootstrap_components as dbc
         layout_factory: LayoutFactory = self.layout_factory
         self._flask = Flask(__name__)
         dash = Dash(
@@ -478,63 +641,135 @@ class TerminalDashServer(object):
             create_terminate_callback(dash)
         if term_cb is not None:
             term_cb(self._shutdown_callback)
+        self._terminates = term_cb is not None
         dash.layout = layout_factory.create_layout()
+        layout_factory.create_data_callback(dash)
+
+    def _serve(self):
+        """Entry point for the server thread."""
+        logger.debug('starting server...')
+        try:
+            self._server.run()
+        except OSError as e:
+            # closing the sockets from another thread can interrupt the loop
+            if not self._shutdown:
+                raise e
 
-    def _child_run(self, queue: multiprocessing.Queue):
-        """Entry point for the child process from a parent spwan."""
-        self._queue = queue
+    def start(self):
+        """Start the Dash server, which accepts connections once this returns.
+
+        :see: :meth:`run`
+
+        """
+        import waitress
+        from waitress import wasyncore
+        self._rendered = threading.Event()
         self._create_flask()
+        # share the socket map to close all of the server's channels
+        self._socket_map: Dict[int, wasyncore.dispatcher] = {}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'starting server on {self.url}')
         try:
-            waitress.serve(self._flask, host=self.host, port=self.port)
+            self._server = waitress.create_server(
+                self._flask, map=self._socket_map,
+                host=self.host, port=self.port, **self._WAITRESS_ARGS)
         except OSError as e:
             raise RenderFileError(
                 f'Could not start server {self.host}:{self.port}: {e}') from e
-        logger.debug('starting flask...')
-        self._flask.run()
+        self._thread = threading.Thread(
+            target=self._serve,
+            name=f'dash-server-{self.port}',
+            daemon=True)
+        self._thread.start()
+        self._STARTED[self.url] = self
+
+    def wait_ready(self) -> bool:
+        """Check that the started server accepts connections.  The server
+        socket is bound and listening once :meth:`start` returns, so this does
+        not poll.
+
+        :return: whether the server accepted a connection within
+                 :obj:`sleep_secs`
+
+        """
+        try:
+            with socket.create_connection(
+                    (self.host, self.port), timeout=self.sleep_secs):
+                return True
+        except OSError as e:
+            logger.warning(f'server {self.url} not accepting connections: {e}')
+            return False
 
     def run(self):
-        """Start the Dash server."""
-        self._par_queue = multiprocessing.Queue()
-        self._proc = multiprocessing.Process(
-            target=self._child_run,
-            args=(self._par_queue,))
-        self._proc.start()
-        # TODO: this should be moved the BrowserManager for a sleep for all
-        # servers in parallel rather than wait for each in series
-        time.sleep(self.sleep_secs)
+        """Start the Dash server and check that it accepts connections."""
+        self.start()
+        self.wait_ready()
+
+    def _wait_rendered(self, timeout_secs: float):
+        """Wait at most ``timeout_secs`` for the page to render."""
+        if timeout_secs > 0:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f'waiting on server for {timeout_secs}s')
+            if not self._rendered.wait(timeout=timeout_secs) and \
+               self._terminates:
+                logger.warning('closed server did not ' +
+                               f'respond after {timeout_secs}s')
+        else:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('closing server')
+
+    def _close(self):
+        """Close the server, which ends the server thread."""
+        from waitress import wasyncore
+        # set before closing so the server thread ignores socket errors
+        self._shutdown = True
+        self._server.task_dispatcher.shutdown()
+        wasyncore.close_all(self._socket_map)
+        self._STARTED.pop(self.url, None)
 
     def shutdown(self, timeout_secs: float = None):
-        """Optionally wait, and then kill the child server processes.
+        """Optionally wait, and then close the server.  A server with no
+        terminate callback (see :obj:`.DataFrameLayoutFactory.server_paging`)
+        serves until the process is interrupted when ``timeout_secs`` is not
+        given.  The interrupt closes all started servers and is re-raised so
+        the caller need not interrupt each server.
 
         :param timeout_secs: the number of seconds to wait before the server
-                            subprocess is killed
+                            is closed
 
         """
         if self._shutdown:
             if logger.isEnabledFor(logging.DEBUG):
                 logger.debug('already shutdown')
+        elif self._server is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('server was not started')
         else:
-            if timeout_secs is None:
-                timeout_secs = self.timeout_secs
-            if timeout_secs > 0:
+            if timeout_secs is None and not self._terminates:
+                # without a terminate callback the page needs the server (such
+                # as for server paging), so serve until interrupted
                 if logger.isEnabledFor(logging.INFO):
-                    logger.info(f'waiting on child for {timeout_secs}s')
+                    logger.info(f'serving {self.url} until interrupted')
                 try:
-                    self._par_queue.get(block=True, timeout=timeout_secs)
-                except Empty:
-                    logger.warning('killed server child process did not ' +
-                                   f'respond after {timeout_secs}s')
+                    self._rendered.wait()
+                except KeyboardInterrupt as e:
+                    logger.info('closing all servers')
+                    server: TerminalDashServer
+                    for server in tuple(self._STARTED.values()):
+                        server._close()
+                    raise e
             else:
-                if logger.isEnabledFor(logging.INFO):
-                    logger.info('killing server child process')
-        self._proc.terminate()
-        self._shutdown = True
+                self._wait_rendered(
+                    self.timeout_secs if timeout_secs is None
+                    else timeout_secs)
+            self._close()
 
 
 @dataclass
 class TerminalDashServerLocation(Location, Deallocatable):
-    """A location started by a :class:`.TerminalDashServer` which waits and
-    kills the child process when it is complete during deallocation.
+    """A location started by a :class:`.TerminalDashServer` which waits for
+    the page to render and then closes the server, which ends its daemon
+    thread, during deallocation.
 
     :see: :meth:`deallocate`
 
@@ -606,6 +841,12 @@ class DataFrameLocationTransmuter(DashServerLocationTransmuter):
     :class:`.TerminalDashServerLocation` instances that use a Dash server to
     render the data.
 
+    """
+    csv_engine: str = field(default='c')
+    """The pandas parser engine used for CSV and TSV files.
+
+    :see: :obj:`.PathDataFrameSource.csv_engine`
+
     """
     def _create_dash_server_loc(self, source: DataFrameSource) -> \
             TerminalDashServerLocation:
@@ -625,7 +866,8 @@ class DataFrameLocationTransmuter(DashServerLocationTransmuter):
 
         """
         source: DataFrameSource
-        for source in PathDataFrameSource.from_path(loc.path):
+        for source in PathDataFrameSource.from_path(
+                loc.path, self.csv_engine):
             yield self._create_dash_server_loc(source)
 
     def transmute(self, location: Location) -> Tuple[Location]:
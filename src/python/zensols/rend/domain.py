@@ -3,19 +3,29 @@
 """
 from __future__ import annotations
 __author__ = 'Paul Landes'
-from typing import Union, Tuple, Any, Set, List
+from typing import Union, Optional, Tuple, Any, Set, List, Sequence
 from dataclasses import dataclass, field
 from abc import abstractmethod, ABCMeta
 import logging
 from enum import Enum, auto
-import urllib.parse as up
+from functools import lru_cache
+from operator import attrgetter
+import re
 from pathlib import Path
 from zensols.util import APIError
 from zensols.config import Dictable
-from zensols.persist import persisted, PersistedWork, PersistableContainer
+from zensols.persist import PersistableContainer
 
 logger = logging.getLogger(__name__)
 
+_URL_REGEX: re.Pattern = re.compile(
+    r'^[\x00-\x20]*([a-zA-Z][a-zA-Z0-9+.\-]*):(?://([^/?#]*))?([^?#]*)')
+"""Matches the scheme, network location and path of a URL (RFC 3986).  Like
+:func:`urllib.parse.urlparse`, leading control characters and spaces are
+skipped.
+
+"""
+
 
 class RenderFileError(APIError):
     """Raised for any :module:`zensols.rend` API error.
@@ -50,21 +60,31 @@ class LocationType(Enum):
         return type
 
     @staticmethod
-    def from_str(s: str) -> Tuple[LocationType, str]:
-        """Return whether ``s`` looks like a file or a URL."""
-        st: LocationType = None
-        path: str = None
-        try:
-            result: up.ParseResult = up.urlparse(s)
-            if result.scheme == 'file' and len(result.path) > 0:
-                st = LocationType.url
-                path = result.path
-            elif all([result.scheme, result.netloc]):
-                st = LocationType.url
-        except Exception:
-            pass
-        st = LocationType.file if st is None else st
-        return st, path
+    def from_str(s: str) -> Tuple[LocationType, Optional[Path]]:
+        """Return whether ``s`` looks like a file or a URL, and the path if it
+        is a file URL.
+
+        """
+        if not isinstance(s, str):
+            # non-string sources, such as dataframes, are files
+            return LocationType.file, None
+        return _location_type_from_str(s)
+
+
+@lru_cache(maxsize=1024)
+def _location_type_from_str(s: str) -> Tuple[LocationType, Optional[Path]]:
+    """The memoized implementation of :meth:`.LocationType.from_str`."""
+    st: LocationType = LocationType.file
+    path: Path = None
+    m: re.Match = _URL_REGEX.match(s)
+    if m is not None:
+        scheme, netloc, url_path = m.groups()
+        if scheme.lower() == 'file' and len(url_path) > 0:
+            st = LocationType.url
+            path = Path(url_path)
+        elif netloc:
+            st = LocationType.url
+    return st, path
 
 
 @dataclass(eq=True, unsafe_hash=True)
@@ -111,8 +131,8 @@ class Location(PersistableContainer, Dictable):
     """Has the ability to find the data and how to view it.
 
     **Important**: All instances of this class must be deallocated using
-    :meth:`deallocate`.  Failure to do so will result in Python interpreter
-    hanging on exit.
+    :meth:`deallocate`.  Failure to do so will leave any servers started for
+    the location running.
 
     """
     source: Union[str, Path] = field()
@@ -123,19 +143,21 @@ class Location(PersistableContainer, Dictable):
 
     def __post_init__(self):
         super().__init__()
-        self._url = PersistedWork('_url', self)
-        self._path = PersistedWork('_path', self)
+        # the URL is computed and cached on first access
+        self._url: str = None
         self._file_url_path = None
-        if self.type is None:
+        if isinstance(self.source, str):
+            if self.type is None:
+                # the path is only given for file URLs
+                self.type, self._file_url_path = \
+                    LocationType.from_str(self.source)
+            if self.type == LocationType.file:
+                self.source = Path(self.source)
+        elif self.type is None:
+            # paths and in memory sources, such as dataframes, are files
+            self.type = LocationType.file
             if isinstance(self.source, Path):
-                self.type = LocationType.file
                 self.validate()
-            else:
-                self.type, path = LocationType.from_str(self.source)
-                if self.type == LocationType.url and path is not None:
-                    self._file_url_path = Path(path)
-        if self.type == LocationType.file and isinstance(self.source, str):
-            self.source = Path(self.source)
 
     def validate(self):
         """Validate the location such as confirming file locations exist.
@@ -154,13 +176,14 @@ class Location(PersistableContainer, Dictable):
         return self._file_url_path is not None
 
     @property
-    @persisted('_url')
     def url(self) -> str:
         """The URL of the location."""
-        url: str = self.source
-        if isinstance(self.source, Path):
-            url = f'file://{self.source.absolute()}'
-        return url
+        if self._url is None:
+            url: str = self.source
+            if isinstance(self.source, Path):
+                url = f'file://{self.source.absolute()}'
+            self._url = url
+        return self._url
 
     @property
     def has_path(self) -> bool:
@@ -171,7 +194,6 @@ class Location(PersistableContainer, Dictable):
         return isinstance(self.source, Path) or self.is_file_url
 
     @property
-    @persisted('_path')
     def path(self) -> Path:
         """The path of the location.
 
@@ -192,18 +214,23 @@ class Location(PersistableContainer, Dictable):
         """
         if location_type != self.type:
             if location_type == LocationType.file:
-                type, path = LocationType.from_str(self.source)
+                # only file URLs can become files; the path is parsed on
+                # creation unless the type was given or coerced to a URL
+                path: Path = self._file_url_path
+                if path is None and isinstance(self.source, str):
+                    path = LocationType.from_str(self.source)[1]
                 if path is not None:
                     self.type = LocationType.file
-                    self.source = Path(path)
+                    self.source = path
+                    self._file_url_path = None
             else:
                 self.source = self.url
                 self.type = LocationType.url
                 self._file_url_path = None
         elif location_type == LocationType.url and self.is_file_url:
             self._file_url_path = None
-        self._url.clear()
-        self._url.clear()
+        # the source might have changed, so invalidate the URL cache
+        self._url = None
 
     def deallocate(self):
         if logger.isEnabledFor(logging.DEBUG):
@@ -232,8 +259,8 @@ class Presentation(PersistableContainer, Dictable):
     display it.
 
     **Important**: All instances of this class must be deallocated using
-    :meth:`deallocate`.  Failure to do so will result in Python interpreter
-    hanging on exit.  Only a deallocation of objects of this class are
+    :meth:`deallocate`.  Failure to do so will leave any servers started for
+    its locations running.  Only a deallocation of objects of this class are
     necessary, and not contained :class:`.Location`.
 
     """
@@ -245,39 +272,57 @@ class Presentation(PersistableContainer, Dictable):
 
     def __post_init__(self):
         super().__init__()
-        self._location_type_set = PersistedWork('_location_type_set', self)
 
     @staticmethod
     def from_str(location_defs: str, delimiter: str = ',',
                  extent: Extent = None) -> Presentation:
         """Create a presentation from a comma-delimited list of locations."""
         locs: Tuple[Location]
-        if delimiter is None:
+        if delimiter is None or delimiter not in location_defs:
             locs = (Location(location_defs),)
         else:
             locs = tuple(map(Location, location_defs.split(delimiter)))
         return Presentation(locs, extent)
 
     @property
-    @persisted('_location_type_set')
     def location_type_set(self) -> Set[LocationType]:
-        """A set of :obj:`locations`."""
-        return frozenset(map(lambda loc: loc.type, self.locations))
+        """A set of :obj:`locations`.  This is computed on each access since
+        :meth:`.Location.coerce_type` can change the type of any location.
 
-    def apply_transmuter(self, transmuter: LocationTransmuter):
+        """
+        return frozenset(map(attrgetter('type'), self.locations))
+
+    def apply_transmuters(self, transmuters: Sequence[LocationTransmuter]):
+        """Replace each location with the locations transmuted from it.  The
+        transmuters are applied in order to each location and the locations
+        they create, which is the same as applying each transmuter to all
+        locations in turn.
+
+        """
         changed: bool = False
         updates: List[Location] = []
         loc: Location
         for loc in self.locations:
-            locs: Tuple[Location] = transmuter.transmute(loc)
-            if len(locs) > 0:
-                updates.extend(locs)
-                changed = True
-            else:
-                updates.append(loc)
+            locs: List[Location] = [loc]
+            transmuter: LocationTransmuter
+            for transmuter in transmuters:
+                tlocs: List[Location] = []
+                tloc: Location
+                for tloc in locs:
+                    trans: Tuple[Location] = transmuter.transmute(tloc)
+                    if len(trans) > 0:
+                        tlocs.extend(trans)
+                        changed = True
+                    else:
+                        tlocs.append(tloc)
+                locs = tlocs
+            updates.extend(locs)
         if changed:
             self.locations = tuple(updates)
-            self._location_type_set.clear()
+
+    def apply_transmuter(self, transmuter: LocationTransmuter):
+        """Replace each location with the locations transmuted from it."""
+        self.apply_transmuters((transmuter,))
 
     def validate(self):
         """Validate all locations.
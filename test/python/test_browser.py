@@ -1,6 +1,13 @@
 import warnings
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
 from screeninfo import ScreenInfoError
-from zensols.rend import Browser, BrowserManager, Application
+from zensols.rend import (
+    Browser, BrowserManager, Application, Presentation, Size, Extent
+)
+from zensols.rend.darwin import DarwinBrowser
 from util import TestApplicationBase
 
 
@@ -14,3 +21,50 @@ class TestBrowser(TestApplicationBase):
             self.assertTrue(browser.screen_size is not None)
         except ScreenInfoError:
             warnings.warn('Warning: could not get screen info--skipping')
+
+    def test_presentation_extent(self):
+        mng: BrowserManager = self.app.browser_manager
+        extent = Extent(700, 1050, -20, 0)
+        pres: Presentation = Presentation.from_str(
+            'http://example.com', extent=extent)
+        self.assertIs(pres, mng.to_presentation(pres))
+        self.assertEqual(extent, pres.extent)
+        given = Extent(10, 20, 0, 0)
+        self.assertEqual(given, mng.to_presentation(pres, given).extent)
+
+
+class TestDarwinBrowser(unittest.TestCase):
+    def setUp(self):
+        # avoid the applescript dependency of the initializer
+        self.browser = DarwinBrowser.__new__(DarwinBrowser)
+
+    def test_quartz_missing(self):
+        with patch.dict(sys.modules, {'Quartz': None}):
+            self.assertIsNone(self.browser._get_quartz_screen_size())
+
+    def test_quartz_displays(self):
+        def union(a, b):
+            return (min(a[0], b[0]), min(a[1], b[1]),
+                    max(a[2], b[2]), max(a[3], b[3]))
+
+        # rectangles are (min x, min y, max x, max y)
+        bounds = {1: (0, 0, 1440, 900), 2: (1440, 0, 3360, 1080)}
+        quartz = SimpleNamespace(
+            CGGetActiveDisplayList=lambda n, ids, cnt: (0, [1, 2, 0], 2),
+            CGDisplayBounds=bounds.get,
+            CGRectUnion=union,
+            CGRectGetMaxX=lambda r: r[2],
+            CGRectGetMaxY=lambda r: r[3])
+        with patch.dict(sys.modules, {'Quartz': quartz}):
+            self.assertEqual(Size(3360, 1080),
+                             self.browser._get_quartz_screen_size())
+            quartz.CGGetActiveDisplayList = lambda n, ids, cnt: (1, None, 0)
+            self.assertIsNone(self.browser._get_quartz_screen_size())
+
+    def test_page_args(self):
+        self.browser.update_page = False
+        self.assertEqual('false, null', self.browser._get_page_args())
+        self.browser.update_page = True
+        self.assertEqual('true, null', self.browser._get_page_args())
+        self.browser.update_page = 3
+        self.assertEqual('true, 3', self.browser._get_page_args())
@@ -1,17 +1,155 @@
 import warnings
+import unittest
+import logging
+import json
+import socket
+import urllib.request
+from unittest.mock import Mock
+from tempfile import TemporaryDirectory
 from pathlib import Path
+import pandas as pd
 from dash import html
+from dash.dash_table import DataTable
 from screeninfo import ScreenInfoError
-from zensols.rend import BrowserManager, Application, Presentation, Location
+from zensols.rend import (
+    BrowserManager, Application, Presentation, Location, LocationType, Extent
+)
 from zensols.rend.df import (
-    DataSourceFrameLayoutFactory, TerminalDashServerLocation
+    PathDataFrameSource, CachedDataFrameSource, DataSourceFrameLayoutFactory,
+    DataFrameLocation, TerminalDashServer, TerminalDashServerLocation
 )
 from util import TestApplicationBase
 
 
+class TestDataFrameSource(unittest.TestCase):
+    def test_cached_read(self):
+        source = PathDataFrameSource(Path('test-resources/states.csv'))
+        df: pd.DataFrame = source.get_dataframe()
+        self.assertEqual(pd.DataFrame, type(df))
+        self.assertTrue(len(df) > 0)
+        self.assertIs(df, source.get_dataframe())
+
+    def test_csv_engine(self):
+        path = Path('test-resources/states.csv')
+        source = PathDataFrameSource.from_path(path)[0]
+        self.assertEqual('c', source.csv_engine)
+        py_source = PathDataFrameSource.from_path(path, 'python')[0]
+        self.assertEqual('python', py_source.csv_engine)
+        self.assertTrue(source.get_dataframe().equals(
+            py_source.get_dataframe()))
+
+    def test_sheets(self):
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'sheets.xlsx'
+            with pd.ExcelWriter(path) as writer:
+                pd.DataFrame({'a': [1]}).to_excel(
+                    writer, sheet_name='one', index=False)
+                pd.DataFrame({'b': [2]}).to_excel(
+                    writer, sheet_name='two', index=False)
+            sources = PathDataFrameSource.from_path(path)
+            self.assertEqual(('one', 'two'),
+                             tuple(map(lambda s: s.get_name(), sources)))
+            self.assertEqual(['b'], sources[1].get_dataframe().columns.tolist())
+
+    def test_location(self):
+        df = pd.DataFrame({'a': [1, 2]})
+        loc = DataFrameLocation(df)
+        self.assertEqual(LocationType.file, loc.type)
+        self.assertIs(df, loc.source.get_dataframe())
+
+    def test_server_paging(self):
+        df = pd.DataFrame({'a': [3, 1, 2], 'b': ['x', 'y', 'z']})
+        lf = DataSourceFrameLayoutFactory(
+            source=CachedDataFrameSource(df), server_paging=True, page_size=2)
+        table: DataTable = lf._create_data_table()
+        self.assertEqual([], table.data)
+        self.assertEqual('custom', table.page_action)
+        self.assertEqual('custom', table.sort_action)
+        self.assertEqual(2, table.page_count)
+        callbacks = []
+
+        class MockDash(object):
+            def callback(self, *args):
+                return callbacks.append
+
+        lf.create_data_callback(MockDash())
+        self.assertEqual(1, len(callbacks))
+        get_page = callbacks[0]
+        self.assertEqual([{'a': 3, 'b': 'x'}, {'a': 1, 'b': 'y'}],
+                         get_page(0, 2, None))
+        sort_by = [{'column_id': 'a', 'direction': 'desc'}]
+        self.assertEqual([{'a': 3, 'b': 'x'}, {'a': 2, 'b': 'z'}],
+                         get_page(0, 2, sort_by))
+        self.assertEqual([{'a': 1, 'b': 'y'}], get_page(1, 2, sort_by))
+        self.assertIsNone(lf.create_terminate_callback(MockDash()))
+        callbacks.clear()
+        lf.server_paging = False
+        lf.create_data_callback(MockDash())
+        self.assertEqual(0, len(callbacks))
+
+
+class TestDashServer(unittest.TestCase):
+    def _get_free_port(self) -> int:
+        with socket.socket() as sock:
+            sock.bind(('localhost', 0))
+            return sock.getsockname()[1]
+
+    def _post_render(self, url: str):
+        output = {'id': 'server-kill-button-container', 'property': 'children'}
+        body = {'output': 'server-kill-button-container.children',
+                'outputs': output,
+                'inputs': [{'id': 'server-kill-submit',
+                            'property': 'n_clicks',
+                            'value': 0}],
+                'changedPropIds': []}
+        req = urllib.request.Request(
+            f'{url}/_dash-update-component',
+            data=json.dumps(body).encode(),
+            headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(req, timeout=5) as res:
+            self.assertEqual(200, res.status)
+
+    def test_render_shutdown(self):
+        lf = DataSourceFrameLayoutFactory(
+            source=PathDataFrameSource(Path('test-resources/states.csv')))
+        server = TerminalDashServer(lf, port=self._get_free_port())
+        server.run()
+        try:
+            with urllib.request.urlopen(server.url, timeout=5) as res:
+                self.assertEqual(200, res.status)
+            self._post_render(server.url)
+        finally:
+            with self.assertNoLogs('zensols.rend.df', logging.WARNING):
+                server.shutdown()
+        server._thread.join(timeout=5)
+        self.assertFalse(server._thread.is_alive())
+        with self.assertRaises(OSError):
+            urllib.request.urlopen(server.url, timeout=1)
+
+    def test_paging_interrupt(self):
+        servers = []
+        for _ in range(2):
+            lf = DataSourceFrameLayoutFactory(
+                source=PathDataFrameSource(Path('test-resources/states.csv')),
+                server_paging=True)
+            server = TerminalDashServer(lf, port=self._get_free_port())
+            server.run()
+            servers.append(server)
+        servers[0]._rendered = Mock(wait=Mock(side_effect=KeyboardInterrupt))
+        with self.assertRaises(KeyboardInterrupt):
+            servers[0].shutdown()
+        for server in servers:
+            self.assertTrue(server._shutdown)
+            server._thread.join(timeout=5)
+            self.assertFalse(server._thread.is_alive())
+            self.assertNotIn(server.url, TerminalDashServer._STARTED)
+        # already closed servers do not wait again
+        servers[1].shutdown()
+
+
 class TestDataFrame(TestApplicationBase):
     APP_ARGS = ('-c test-resources/rend.conf --level=err config ' +
-                '--override=data_frame_location_transmuter.run_servers=False')
+                '--override=rend_data_frame_location_transmuter.run_servers=False')
 
     def test_dash_app(self):
         app: Application = self.app
@@ -50,3 +188,18 @@ class TestDataFrame(TestApplicationBase):
         finally:
             if pres is not None:
                 pres.deallocate()
+
+    def test_dash_app_sequence(self):
+        mng: BrowserManager = self.app.browser_manager
+        path = Path('test-resources/states.csv')
+        pres: Presentation = None
+        try:
+            # an explicit extent avoids querying the screen
+            pres = mng.to_presentation([path, path], extent=Extent(1, 2))
+            self.assertEqual(2, len(pres.locations))
+            self.assertEqual(
+                ('http://localhost:8050', 'http://localhost:8051'),
+                tuple(map(lambda loc: loc.url, pres.locations)))
+        finally:
+            if pres is not None:
+                pres.deallocate()
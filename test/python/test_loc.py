@@ -1,11 +1,24 @@
 from pathlib import Path
 import os
 import unittest
+from typing import Tuple
 from zensols.rend import (
-    FileNotFoundError, RenderFileError, LocationType, Location
+    FileNotFoundError, RenderFileError, LocationType, Location,
+    LocationTransmuter, Presentation
 )
 
 
+class _SuffixTransmuter(LocationTransmuter):
+    def __init__(self, suffix: str):
+        self.suffix = suffix
+
+    def transmute(self, location: Location) -> Tuple[Location]:
+        source: str = str(location.source)
+        if source.endswith(self.suffix):
+            return (Location(source + '.a'), Location(source + '.b'))
+        return ()
+
+
 class TestLocation(unittest.TestCase):
     def test_type(self):
         loc = Location('http://example.com')
@@ -29,6 +42,10 @@ class TestLocation(unittest.TestCase):
         self.assertTrue(loc.is_file_url)
         self.assertEqual(Path('/somedir/file.txt'), loc.path)
 
+        pres = Presentation.from_str('a.pdf, http://example.com')
+        self.assertEqual((LocationType.file, LocationType.url),
+                         tuple(map(lambda loc: loc.type, pres.locations)))
+
     def test_validate(self):
         loc = Location('test-resources/sample.pdf')
         loc.validate()
@@ -42,7 +59,10 @@ class TestLocation(unittest.TestCase):
 
     def test_coerce(self):
         loc = Location('test-resources/sample.pdf')
+        self.assertEqual(Path('test-resources/sample.pdf'), loc.path)
         loc.coerce_type(LocationType.url)
+        with self.assertRaisesRegex(RenderFileError, '^Not a path'):
+            loc.path
         self.assertEqual(LocationType.url, loc.type)
         url = f'file://{os.getcwd()}/test-resources/sample.pdf'
         self.assertEqual(url, loc.source)
@@ -53,3 +73,30 @@ class TestLocation(unittest.TestCase):
         self.assertEqual(LocationType.file, loc.type)
         self.assertEqual(Path('/somedir/file.txt'), loc.source)
         self.assertEqual(Path('/somedir/file.txt'), loc.path)
+        self.assertFalse(loc.is_file_url)
+
+        loc = Location('file:///x.pdf', LocationType.url)
+        loc.coerce_type(LocationType.file)
+        self.assertEqual(LocationType.file, loc.type)
+        self.assertEqual(Path('/x.pdf'), loc.source)
+
+        loc = Location('file:///somedir/file.txt')
+        loc.coerce_type(LocationType.url)
+        self.assertFalse(loc.is_file_url)
+        loc.coerce_type(LocationType.file)
+        self.assertEqual(LocationType.file, loc.type)
+        self.assertEqual(Path('/somedir/file.txt'), loc.path)
+
+        pres = Presentation.from_str('a.pdf,b.pdf')
+        self.assertEqual({LocationType.file}, pres.location_type_set)
+        for loc in pres.locations:
+            loc.coerce_type(LocationType.url)
+        self.assertEqual({LocationType.url}, pres.location_type_set)
+
+    def test_transmute(self):
+        pres = Presentation((Location('one.x'), Location('two.y')))
+        pres.apply_transmuters((_SuffixTransmuter('.x'),
+                                _SuffixTransmuter('.b')))
+        self.assertEqual(('one.x.a', 'one.x.b.a', 'one.x.b.b', 'two.y'),
+                         tuple(map(lambda loc: str(loc.source), pres.locations)))
+        self.assertEqual({LocationType.file}, pres.location_type_set)
@@ -12,6 +12,9 @@ class TestApplication(TestApplicationBase):
         self.assertEqual(['laptop'], browser_manager.display_names)
         display: Display = browser_manager.displays['laptop']
         self.assertEqual('1024 X 760 (laptop)', str(display))
+        self.assertEqual((700, 1050, -20, 0), (
+            display.target.width, display.target.height,
+            display.target.x, display.target.y))
 
     def test_preview_script(self):
         app: Union[ApplicationFailure, Application] = self.app